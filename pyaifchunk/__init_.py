@@ -1,2 +1,2 @@
 from .core_aifc import *
-from .core_chunk import Chunk
+from .core_chunk import Chunk, ChunkView, iter_chunks
@@ -0,0 +1,280 @@
+# cython: language_level=3
+"""
+Cython accelerator for the Chunk hot path.
+
+This mirrors pyaifchunk.core_chunk.Chunk: the header parse, read() and
+the position bookkeeping run as compiled C instead of interpreted
+bytecode.  core_chunk imports this class when the extension has been
+built and silently keeps the pure-Python implementation otherwise, so
+the chunk API (getname/getsize/read/readinto/read1/seek/tell/skip/close,
+from_bytes/from_path, the context-manager protocol, the closed property
+and the readable _file attribute) must stay behaviourally identical
+between the two.
+
+Known divergence: a cdef class cannot inherit the io.RawIOBase C type,
+so core_chunk registers this class with the ABC instead — isinstance
+checks and io.BufferedReader composition work, but the IOBase
+conveniences that the pure-Python class inherits and this one does not
+implement (readline, line iteration, flush) are unavailable.
+"""
+
+import io
+import mmap
+import os
+
+
+cdef class Chunk:
+    """
+    Accelerated reader for IFF chunked data; see core_chunk.Chunk for the
+    full protocol documentation.
+    """
+
+    # _file is readonly-visible from Python: callers (and the test
+    # suite) reach the underlying stream through it, exactly as on the
+    # pure-Python class.
+    cdef readonly object _file
+    cdef object _f_read, _f_seek, _f_tell, _f_readinto
+    cdef bint _align, _bigendian, _inclheader, _closed, _io_closed
+    cdef bint _is_bytesio, _is_mmap, _advise, _use_pread
+    cdef bytes _name
+    cdef unsigned long long _data_size, _data_start, _read_end, _chunk_end, _pos
+    cdef unsigned long long _fpos
+    cdef unsigned int _pad
+    cdef long long _fd
+
+    def __init__(self, file, bint align=True, bint bigendian=True,
+                 bint inclheader=False, bint advise=False):
+        cdef const unsigned char[:] hdr
+        cdef unsigned long long size_value
+
+        self._file = file
+        self._f_read = file.read
+        self._f_seek = file.seek
+        self._f_tell = file.tell
+        self._f_readinto = getattr(file, 'readinto', None)
+        self._is_bytesio = isinstance(file, io.BytesIO)
+        self._is_mmap = isinstance(file, mmap.mmap)
+        self._align = align
+        self._bigendian = bigendian
+        self._inclheader = inclheader
+        self._closed = False
+        self._io_closed = False
+
+        header = self._f_read(8)
+        if len(header) < 8:
+            raise EOFError("Not enough bytes to read a complete chunk header")
+        self._name = header[:4]
+
+        # Inline size-field parse: four shifts and ors, no struct call.
+        hdr = header
+        if bigendian:
+            size_value = ((<unsigned long long>hdr[4] << 24)
+                          | (hdr[5] << 16) | (hdr[6] << 8) | hdr[7])
+        else:
+            size_value = ((<unsigned long long>hdr[7] << 24)
+                          | (hdr[6] << 16) | (hdr[5] << 8) | hdr[4])
+
+        if inclheader:
+            if size_value < 8:
+                raise ValueError("Size field is smaller than header size")
+            self._data_size = size_value - 8
+        else:
+            self._data_size = size_value
+
+        self._data_start = self._f_tell()
+        self._read_end = self._data_start + self._data_size
+        self._pad = align & self._data_size & 1
+        self._chunk_end = self._read_end + self._pad
+        self._pos = self._data_start
+
+        self._fd = -1
+        if hasattr(file, 'fileno'):
+            try:
+                self._fd = file.fileno()
+            except (OSError, io.UnsupportedOperation):
+                pass
+
+        self._advise = advise and self._fd >= 0 and hasattr(os, 'posix_fadvise')
+        if self._advise:
+            os.posix_fadvise(self._fd, self._data_start, self._data_size,
+                             os.POSIX_FADV_SEQUENTIAL)
+
+        # fd-backed reads are served by os.pread at the tracked offset;
+        # only raw file backings qualify, since wrappers like GzipFile
+        # report logical offsets unrelated to fd offsets.  _fpos mirrors
+        # the stream's real cursor for lazy resyncs.
+        self._use_pread = (self._fd >= 0 and hasattr(os, 'pread')
+                           and isinstance(file, (io.FileIO, io.BufferedReader,
+                                                 io.BufferedRandom)))
+        self._fpos = self._data_start
+
+    @classmethod
+    def from_bytes(cls, buf, offset=0, **kw):
+        from .core_chunk import _BufferReader
+        reader = _BufferReader(buf)
+        if offset:
+            reader.seek(offset)
+        return cls(reader, **kw)
+
+    @classmethod
+    def from_path(cls, path, **kw):
+        from .core_chunk import _MmapView
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        return cls(_MmapView(mm), **kw)
+
+    cpdef bytes getname(self):
+        return self._name
+
+    cpdef unsigned long long getsize(self):
+        return self._data_size
+
+    def read(self, long long size=-1):
+        cdef long long remaining
+        if self._closed:
+            raise OSError("Chunk is closed")
+        remaining = self._read_end - self._pos
+        if remaining <= 0:
+            return b''
+        if size < 0 or size > remaining:
+            if self._is_bytesio:
+                view = self._file.getbuffer()
+                out = bytes(view[self._pos:self._read_end])
+                view.release()
+                self._f_seek(self._read_end)
+                self._pos = self._read_end
+                return out
+            if self._is_mmap:
+                out = self._file[self._pos:self._read_end]
+                self._f_seek(self._read_end)
+                self._pos = self._read_end
+                return out
+            size = remaining
+        if self._use_pread and self._fpos != self._pos:
+            # The cursor drifted because seek() was deferred: one pread
+            # replaces the lseek/read pair.  Exhausting the chunk resyncs
+            # the stream cursor so the next Chunk parses correctly.
+            buf = os.pread(self._fd, size, self._pos)
+            self._pos += len(buf)
+            if self._pos >= self._read_end:
+                self._f_seek(self._pos)
+                self._fpos = self._pos
+            return buf
+        buf = self._f_read(size)
+        self._pos += len(buf)
+        self._fpos = self._pos
+        return buf
+
+    def readinto(self, b):
+        cdef long long remaining, n
+        if self._closed:
+            raise OSError("Chunk is closed")
+        remaining = self._read_end - self._pos
+        if remaining <= 0:
+            return 0
+        mv = memoryview(b)
+        if len(mv) > remaining:
+            mv = mv[:remaining]
+        if self._use_pread and self._fpos != self._pos:
+            self._f_seek(self._pos)
+        if self._f_readinto is not None:
+            n = self._f_readinto(mv)
+        else:
+            data = self._f_read(len(mv))
+            n = len(data)
+            mv[:n] = data
+        self._pos += n
+        self._fpos = self._pos
+        return n
+
+    def read1(self, long long size=-1):
+        cdef long long remaining
+        if self._closed:
+            raise OSError("Chunk is closed")
+        remaining = self._read_end - self._pos
+        if remaining <= 0:
+            return b''
+        if size < 0 or size > remaining:
+            size = remaining
+        if self._use_pread and self._fpos != self._pos:
+            self._f_seek(self._pos)
+        read1 = getattr(self._file, 'read1', self._f_read)
+        buf = read1(size)
+        self._pos += len(buf)
+        self._fpos = self._pos
+        return buf
+
+    def seek(self, long long pos, int whence=0):
+        cdef long long target
+        if self._closed:
+            raise OSError("Chunk is closed")
+        if whence == 0:
+            target = self._data_start + pos
+        elif whence == 1:
+            target = self._pos + pos
+        elif whence == 2:
+            target = self._read_end + pos
+        else:
+            raise ValueError("Invalid value for whence")
+        target = min(max(target, <long long>self._data_start),
+                     <long long>self._read_end)
+        if not self._use_pread:
+            self._f_seek(target)
+        self._pos = target
+        return target - self._data_start
+
+    def tell(self):
+        if self._closed:
+            raise OSError("Chunk is closed")
+        return self._pos - self._data_start
+
+    def readable(self):
+        return not self._closed
+
+    def writable(self):
+        return False
+
+    def seekable(self):
+        return True
+
+    @property
+    def closed(self):
+        # Mirrors IOBase semantics: True only after an explicit close(),
+        # not after skip().
+        return self._io_closed
+
+    def __enter__(self):
+        if self._io_closed:
+            raise ValueError("I/O operation on closed file.")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def skip(self):
+        cdef long long skipped
+        if not self._closed:
+            skipped = self._chunk_end - self._pos
+            self._f_seek(self._chunk_end)
+            if self._advise and skipped > 0:
+                os.posix_fadvise(self._fd, self._pos, skipped,
+                                 os.POSIX_FADV_DONTNEED)
+            self._pos = self._chunk_end
+            self._fpos = self._chunk_end
+            self._closed = True
+
+    def close(self):
+        if not self._closed:
+            try:
+                self.skip()
+            except ValueError:
+                pass
+        self._io_closed = True
+
+    def isatty(self):
+        return False
@@ -1,7 +1,91 @@
-class Chunk:
+import io
+import mmap
+import os
+import struct
+
+# Precompiled size-field parsers: one C-level unpack per header instead of
+# re-dispatching on a byteorder string for every chunk.
+_U32_BE = struct.Struct(">I")
+_U32_LE = struct.Struct("<I")
+
+# Whole-header parsers for the one-pass sweep in iter_chunks().
+_HDR_BE = struct.Struct(">4sI")
+_HDR_LE = struct.Struct("<4sI")
+
+
+class _BufferReader:
+    """
+    A minimal file-like reader over any buffer-protocol object
+    (bytes, bytearray, memoryview, mmap).
+
+    read()/readinto()/seek()/tell() slice a memoryview of the buffer, so
+    in-memory payloads can be parsed without a BytesIO wrapper and its
+    copy semantics.
+    """
+
+    __slots__ = ('_view', '_pos')
+
+    def __init__(self, buf):
+        self._view = buf if isinstance(buf, memoryview) else memoryview(buf)
+        self._pos = 0
+
+    def read(self, size=-1):
+        pos = self._pos
+        end = len(self._view) if size < 0 else min(pos + size, len(self._view))
+        self._pos = end
+        return bytes(self._view[pos:end])
+
+    def readinto(self, b):
+        pos = self._pos
+        n = min(len(b), len(self._view) - pos)
+        b[:n] = self._view[pos:pos + n]
+        self._pos = pos + n
+        return n
+
+    def seek(self, pos, whence=0):
+        if whence == 0:
+            self._pos = pos
+        elif whence == 1:
+            self._pos += pos
+        elif whence == 2:
+            self._pos = len(self._view) + pos
+        else:
+            raise ValueError("Invalid value for whence")
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        self._view.release()
+
+
+class _MmapView(_BufferReader):
+    """
+    A _BufferReader over a read-only mmap: after the initial mapping,
+    reads are serviced from the page cache via page faults with no
+    further syscalls.  close() also unmaps the file.
+    """
+
+    __slots__ = ('_mm',)
+
+    def __init__(self, mm):
+        super().__init__(mm)
+        self._mm = mm
+
+    def close(self):
+        super().close()
+        self._mm.close()
+
+
+class Chunk(io.RawIOBase):
     """
     A class to read IFF chunked data from a file-like object.
 
+    Subclassing io.RawIOBase makes a Chunk a real raw stream, so it can be
+    wrapped in io.BufferedReader to get the stdlib's C-implemented
+    buffering over a slow underlying file.
+
     An IFF chunk has the following structure:
         Offset 0-3: 4-byte chunk ID (string)
         Offset 4-7: 4-byte size field (big-endian by default) indicating the size of the chunk's data,
@@ -17,19 +101,43 @@ class Chunk:
         _name: The 4-byte chunk ID.
         _data_size: The size of the chunk data (excluding header, unless inclheader is True).
         _data_start: File position where the data starts.
-        _data_end: File position marking the end of the chunk data.
+        _read_end: File position marking the end of the chunk data (pad excluded).
+        _chunk_end: File position marking the chunk's full extent (pad included).
+        _pos: Internally tracked absolute file position of the next read.
+        _fd: File descriptor used for kernel access-pattern hints, or -1.
         _closed: Boolean flag that becomes True after skip() or close() is called.
     """
 
-    def __init__(self, file, align: bool = True, bigendian: bool = True, inclheader: bool = False):
+    # Fixed-offset slot descriptors for the attributes used in the
+    # read/seek/tell hot paths.  Note the io.RawIOBase base still gives
+    # every instance a __dict__, so this buys faster lookups for the
+    # listed names, not the smaller dict-free layout a plain class would
+    # get.
+    __slots__ = ('_file', '_f_read', '_f_seek', '_f_tell', '_f_readinto',
+                 '_align', '_bigendian', '_inclheader', '_closed', '_name',
+                 '_data_size', '_data_start', '_read_end', '_chunk_end',
+                 '_pad', '_pos', '_fd', '_is_bytesio', '_is_mmap',
+                 '_advise', '_use_pread', '_fpos')
+
+    def __init__(self, file, align: bool = True, bigendian: bool = True, inclheader: bool = False,
+                 advise: bool = False):
         self._file = file
+        # Cache the bound methods: read/seek/tell are called once or more per
+        # chunk, and the cached lookups avoid a LOAD_ATTR pair on each call.
+        self._f_read = file.read
+        self._f_seek = file.seek
+        self._f_tell = file.tell
+        self._f_readinto = getattr(file, 'readinto', None)
+        # Known in-memory backings get a direct-slice fast path in read().
+        self._is_bytesio = isinstance(file, io.BytesIO)
+        self._is_mmap = isinstance(file, mmap.mmap)
         self._align = align
         self._bigendian = bigendian
         self._inclheader = inclheader
         self._closed = False
 
         # Read the 8-byte header
-        header = self._file.read(8)
+        header = self._f_read(8)
         if len(header) < 8:
             raise EOFError("Not enough bytes to read a complete chunk header")
 
@@ -37,9 +145,7 @@ class Chunk:
         self._name = header[:4]
 
         # Next 4 bytes: size field
-        size_field = header[4:8]
-        byteorder = 'big' if self._bigendian else 'little'
-        size_value = int.from_bytes(size_field, byteorder=byteorder)
+        size_value = (_U32_BE if self._bigendian else _U32_LE).unpack_from(header, 4)[0]
 
         # If inclheader is True, then the size includes the header; adjust accordingly.
         if self._inclheader:
@@ -50,15 +156,85 @@ class Chunk:
             self._data_size = size_value
 
         # Record current file pointer as the start of the chunk data.
-        self._data_start = self._file.tell()
-        self._data_end = self._data_start + self._data_size
+        # _read_end bounds read()/readinto()/read1() (pad byte excluded);
+        # _chunk_end is the chunk's full extent including any pad byte and
+        # is where skip() leaves the stream.
+        self._data_start = self._f_tell()
+        self._read_end = self._data_start + self._data_size
 
-        # If alignment is enabled and the data size is odd, a pad byte follows.
-        if self._align and (self._data_size % 2 != 0):
-            self._pad = 1
-            self._data_end += 1  # account for pad byte
-        else:
-            self._pad = 0
+        # If alignment is enabled and the data size is odd, a pad byte
+        # follows; bool & int makes the computation branchless.
+        self._pad = self._align & self._data_size & 1
+        self._chunk_end = self._read_end + self._pad
+
+        # Absolute file offset of the next read.  Tracking it here lets
+        # read()/tell() avoid a tell() call on the underlying stream, which
+        # can be surprisingly expensive for buffered file objects.
+        self._pos = self._data_start
+
+        self._fd = -1
+        if hasattr(file, 'fileno'):
+            try:
+                self._fd = file.fileno()
+            except (OSError, io.UnsupportedOperation):
+                pass
+
+        # Optionally tell the kernel the chunk will be read sequentially,
+        # enlarging its readahead window.  Only possible for fd-backed
+        # files on platforms with posix_fadvise.
+        self._advise = advise and self._fd >= 0 and hasattr(os, 'posix_fadvise')
+        if self._advise:
+            os.posix_fadvise(self._fd, self._data_start, self._data_size,
+                             os.POSIX_FADV_SEQUENTIAL)
+
+        # On POSIX, fd-backed reads go through os.pread at the tracked
+        # offset: a seek followed by a read costs one syscall instead of
+        # an lseek/read pair, and the shared fd cursor is left alone.
+        # Only raw file backings qualify — for decompressing wrappers like
+        # GzipFile the logical offsets have nothing to do with fd offsets,
+        # and pread would return compressed bytes.  _fpos mirrors the
+        # underlying stream's real cursor so the stream-based paths
+        # (readinto/read1) can resync lazily.
+        self._use_pread = (self._fd >= 0 and hasattr(os, 'pread')
+                           and isinstance(file, (io.FileIO, io.BufferedReader,
+                                                 io.BufferedRandom)))
+        self._fpos = self._data_start
+
+    @classmethod
+    def from_bytes(cls, buf, offset: int = 0, **kw):
+        """
+        Parses a chunk directly from an in-memory bytes-like object
+        (bytes, bytearray, memoryview), starting at 'offset'.
+
+        The buffer is wrapped in a lightweight memoryview-backed reader,
+        skipping io.BytesIO entirely — no wrapper object copy semantics,
+        no stream bookkeeping.  Keyword arguments are forwarded to the
+        constructor.
+        """
+        reader = _BufferReader(buf)
+        if offset:
+            reader.seek(offset)
+        return cls(reader, **kw)
+
+    @classmethod
+    def from_path(cls, path, **kw):
+        """
+        Opens the file at 'path' read-only via mmap and returns a Chunk
+        positioned at its first chunk header.
+
+        The mapping replaces per-read() syscalls with page-cache-backed
+        memory loads, which is the fast path for parsing files with many
+        chunks. Keyword arguments are forwarded to the constructor.
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        # IFF files are walked forward; hint the kernel accordingly.
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        return cls(_MmapView(mm), **kw)
 
     def getname(self):
         """
@@ -77,20 +253,108 @@ class Chunk:
         Reads up to 'size' bytes from the chunk's data.
 
         If size is negative or omitted, read all remaining data from the chunk.
-        Reading does not go past the end of the chunk (including the pad byte).
+        Reading does not go past the end of the chunk data; the pad byte is
+        never returned.
         """
         if self._closed:
             raise OSError("Chunk is closed")
 
-        current_pos = self._file.tell()
-        # Calculate how many bytes remain in the chunk (data plus pad, if applicable)
-        remaining = self._data_end - current_pos
+        # Calculate how many data bytes remain in the chunk (pad excluded)
+        remaining = self._read_end - self._pos
         if remaining <= 0:
             return b''
 
         if size < 0 or size > remaining:
+            # "Read the rest of the chunk" is the common case; for
+            # in-memory backings it reduces to one slice, bypassing the
+            # file object's read machinery.
+            if self._is_bytesio:
+                view = self._file.getbuffer()
+                out = bytes(view[self._pos:self._read_end])
+                view.release()
+                self._f_seek(self._read_end)
+                self._pos = self._read_end
+                return out
+            if self._is_mmap:
+                out = self._file[self._pos:self._read_end]
+                self._f_seek(self._read_end)
+                self._pos = self._read_end
+                return out
             size = remaining
-        return self._file.read(size)
+        if self._use_pread and self._fpos != self._pos:
+            # The cursor drifted because seek() was deferred: one pread
+            # replaces the lseek/read pair.
+            buf = os.pread(self._fd, size, self._pos)
+            self._pos += len(buf)
+            # Exhausting a chunk must leave the stream cursor at the end
+            # of its data, as plain reads would, so callers can construct
+            # the next Chunk on the same stream without an explicit skip().
+            if self._pos >= self._read_end:
+                self._f_seek(self._pos)
+                self._fpos = self._pos
+            return buf
+        buf = self._f_read(size)
+        self._pos += len(buf)
+        self._fpos = self._pos
+        return buf
+
+    def readinto(self, b):
+        """
+        Reads bytes into a pre-allocated, writable buffer 'b' (e.g. a
+        bytearray or memoryview) and returns the number of bytes read.
+
+        The read is clamped to the remaining chunk data, so at most
+        min(len(b), remaining) bytes are written.  Unlike read(), no new
+        bytes object is allocated, which lets callers reuse one buffer
+        across many chunks.
+        """
+        if self._closed:
+            raise OSError("Chunk is closed")
+
+        remaining = self._read_end - self._pos
+        if remaining <= 0:
+            return 0
+
+        mv = memoryview(b)
+        if len(mv) > remaining:
+            mv = mv[:remaining]
+        if self._use_pread and self._fpos != self._pos:
+            self._f_seek(self._pos)
+        if self._f_readinto is not None:
+            n = self._f_readinto(mv)
+        else:
+            # Underlying file has no readinto(); fall back to read + copy.
+            data = self._f_read(len(mv))
+            n = len(data)
+            mv[:n] = data
+        self._pos += n
+        self._fpos = self._pos
+        return n
+
+    def read1(self, size=-1):
+        """
+        Reads up to 'size' bytes using at most one call on the underlying
+        file, preferring its read1() when available.
+
+        This matches the io.BufferedIOBase protocol, so a Chunk can be
+        wrapped in io.BufferedReader for free buffering.
+        """
+        if self._closed:
+            raise OSError("Chunk is closed")
+
+        remaining = self._read_end - self._pos
+        if remaining <= 0:
+            return b''
+
+        if size < 0 or size > remaining:
+            size = remaining
+        if self._use_pread and self._fpos != self._pos:
+            self._f_seek(self._pos)
+        read1 = getattr(self._file, 'read1', self._f_read)
+        buf = read1(size)
+        self._pos += len(buf)
+        self._fpos = self._pos
+        return buf
 
     def seek(self, pos, whence=0):
         """
@@ -101,22 +365,17 @@ class Chunk:
         if self._closed:
             raise OSError("Chunk is closed")
 
-        # Determine absolute target position relative to _data_start
-        if whence == 0:
-            target = self._data_start + pos
-        elif whence == 1:
-            target = self._file.tell() + pos
-        elif whence == 2:
-            target = self._data_end + pos
-        else:
+        # Branchless whence dispatch: index a base-offset table instead of
+        # an if/elif ladder, then clamp with min/max.
+        if whence not in (0, 1, 2):
             raise ValueError("Invalid value for whence")
-
-        # Clamp target within chunk boundaries
-        if target < self._data_start:
-            target = self._data_start
-        if target > self._data_end:
-            target = self._data_end
-        self._file.seek(target)
+        target = (self._data_start, self._pos, self._read_end)[whence] + pos
+        target = min(max(target, self._data_start), self._read_end)
+        # pread-served reads ignore the stream cursor, so the seek is
+        # deferred until a stream-based path needs it.
+        if not self._use_pread:
+            self._f_seek(target)
+        self._pos = target
         return target - self._data_start
 
     def tell(self):
@@ -125,7 +384,25 @@ class Chunk:
         """
         if self._closed:
             raise OSError("Chunk is closed")
-        return self._file.tell() - self._data_start
+        return self._pos - self._data_start
+
+    def readable(self):
+        """
+        Returns True while the chunk has not been skipped or closed.
+        """
+        return not self._closed
+
+    def writable(self):
+        """
+        Returns False; chunks are read-only.
+        """
+        return False
+
+    def seekable(self):
+        """
+        Returns True; seeking within the chunk data is always supported.
+        """
+        return True
 
     def skip(self):
         """
@@ -133,7 +410,14 @@ class Chunk:
         Subsequent calls to read() will return an empty bytes object.
         """
         if not self._closed:
-            self._file.seek(self._data_end)
+            skipped = self._chunk_end - self._pos
+            self._f_seek(self._chunk_end)
+            # Let the kernel drop pages for data we jumped over.
+            if self._advise and skipped > 0:
+                os.posix_fadvise(self._fd, self._pos, skipped,
+                                 os.POSIX_FADV_DONTNEED)
+            self._pos = self._chunk_end
+            self._fpos = self._chunk_end
             self._closed = True
 
     def close(self):
@@ -141,10 +425,172 @@ class Chunk:
         Convenience method to skip to the end of the chunk.
         Does not close the underlying file.
         """
-        self.skip()
+        if not self._closed:
+            try:
+                self.skip()
+            except ValueError:
+                # The underlying file was already closed; nothing to skip.
+                pass
+        super().close()
+
+    def __del__(self):
+        # IOBase finalization calls close(); moving the shared underlying
+        # stream as a garbage-collection side effect would corrupt other
+        # readers, so an implicitly dropped chunk is only marked closed.
+        self._closed = True
+        super().__del__()
 
     def isatty(self):
         """
         Returns False as the chunk is not associated with a terminal.
         """
         return False
+
+
+class ChunkView:
+    """
+    A lightweight, pre-located view of one chunk inside an in-memory buffer.
+
+    Produced by iter_chunks().  The view shares the underlying buffer via
+    memoryview, so no chunk data is copied until the caller asks for bytes.
+    It mirrors the read-side Chunk API (getname/getsize/read/seek/tell).
+    """
+
+    __slots__ = ('_buf', '_name', '_data_size', '_data_start', '_pad', '_cursor')
+
+    def __init__(self, buf, name, data_size, data_start, pad):
+        self._buf = buf
+        self._name = name
+        self._data_size = data_size
+        self._data_start = data_start
+        self._pad = pad
+        self._cursor = 0
+
+    def getname(self):
+        """
+        Returns the 4-byte chunk ID.
+        """
+        return self._name
+
+    def getsize(self):
+        """
+        Returns the size of the chunk data.
+        """
+        return self._data_size
+
+    def read(self, size=-1):
+        """
+        Reads up to 'size' bytes from the chunk's data by slicing the
+        shared buffer; the pad byte is never returned.
+        """
+        remaining = self._data_size - self._cursor
+        if remaining <= 0:
+            return b''
+        if size < 0 or size > remaining:
+            size = remaining
+        start = self._data_start + self._cursor
+        self._cursor += size
+        return bytes(self._buf[start:start + size])
+
+    def seek(self, pos, whence=0):
+        """
+        Seek to a position within the chunk data.
+
+        whence: 0 (absolute within chunk), 1 (relative to current position),
+        2 (relative to chunk's end).
+        """
+        if whence == 0:
+            target = pos
+        elif whence == 1:
+            target = self._cursor + pos
+        elif whence == 2:
+            target = self._data_size + pos
+        else:
+            raise ValueError("Invalid value for whence")
+        self._cursor = min(max(target, 0), self._data_size)
+        return self._cursor
+
+    def tell(self):
+        """
+        Returns the current position within the chunk data.
+        """
+        return self._cursor
+
+    def skip(self):
+        """
+        A no-op: every view is already located by the header sweep, so
+        moving to the next chunk costs nothing.
+        """
+
+    def close(self):
+        """
+        A no-op, kept for Chunk API compatibility.
+        """
+
+
+def iter_chunks(source, align: bool = True, bigendian: bool = True, inclheader: bool = False,
+                advise: bool = False):
+    """
+    Iterates over every chunk in 'source', yielding ChunkView objects.
+
+    'source' is any object supporting the buffer protocol (bytes,
+    bytearray, memoryview, mmap) or a file-like object, which is read
+    fully into memory first.  All 8-byte headers are parsed in a single
+    pass into parallel arrays up front, so iterating N chunks costs one
+    sweep plus N lightweight view constructions instead of N full Chunk
+    initializations with their per-chunk reads.
+    """
+    if hasattr(source, 'read'):
+        data = source.read()
+        buf = memoryview(data)
+        # With advise=True (mirroring Chunk's opt-in), tell the kernel the
+        # page-cache copy of the consumed range is no longer needed: the
+        # bytes now live in process memory.  One coalesced hint replaces a
+        # per-skipped-chunk lseek/fadvise pattern, but it evicts the file
+        # from cache for later readers, hence the opt-in.
+        if advise and hasattr(os, 'posix_fadvise') and hasattr(source, 'fileno') \
+                and hasattr(source, 'tell'):
+            try:
+                end = source.tell()
+                os.posix_fadvise(source.fileno(), end - len(data), len(data),
+                                 os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+    else:
+        buf = memoryview(source)
+
+    hdr = _HDR_BE if bigendian else _HDR_LE
+    total = len(buf)
+
+    # One-pass header sweep: chunk metadata lands in parallel arrays.
+    names, sizes, starts, pads = [], [], [], []
+    offset = 0
+    while offset + 8 <= total:
+        name, size = hdr.unpack_from(buf, offset)
+        if inclheader:
+            if size < 8:
+                raise ValueError("Size field is smaller than header size")
+            size -= 8
+        data_start = offset + 8
+        pad = align & size & 1
+        names.append(name)
+        sizes.append(size)
+        starts.append(data_start)
+        pads.append(pad)
+        offset = data_start + size + pad
+
+    for i in range(len(names)):
+        yield ChunkView(buf, names[i], sizes[i], starts[i], pads[i])
+
+
+# Prefer the compiled hot path when the optional Cython extension was
+# built (see _core_chunk.pyx); the class above is the pure-Python
+# fallback.  The cdef class cannot inherit io.RawIOBase, so it is
+# registered with the ABC to keep isinstance checks working; see the
+# .pyx docstring for the remaining differences.
+try:
+    from ._core_chunk import Chunk  # noqa: F811
+except ImportError:
+    pass
+else:
+    io.RawIOBase.register(Chunk)
@@ -1,39 +1,25 @@
-from setuptools import find_packages, setup
+import os
 
-# Read version from version.txt
-with open("version.txt", "r", encoding="utf-8") as vf:
-    version = vf.read().strip()
+from setuptools import Extension, setup
 
-# Read long description from README.md
-with open("README.md", "r", encoding="utf-8") as f:
-    long_description = f.read()
+# Metadata lives in pyproject.toml; this file only wires up the optional
+# Cython accelerator and supports legacy `python setup.py` invocations.
+# The extension is best-effort: without Cython, or from an sdist that
+# was built without the .pyx, the pure-Python core_chunk.Chunk is used
+# instead.  The Extension spells out the dotted module name because the
+# package directory has no __init__.py, so Cython would otherwise build
+# a top-level _core_chunk module that core_chunk's relative import
+# could never find.
+ext_modules = []
+if os.path.exists("pyaifchunk/_core_chunk.pyx"):
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        pass
+    else:
+        ext_modules = cythonize(
+            [Extension("pyaifchunk._core_chunk",
+                       ["pyaifchunk/_core_chunk.pyx"])],
+            language_level=3)
 
-setup(
-    name="pyaifchunk",
-    version=version,
-    author="wambua",
-    author_email="swskye17@gmail.com",
-    description="A re-implementation of the IFF chunk module for reading chunked file data.",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://pypi.org/project/PyChunkCore/",
-    packages=["pyaifchunk"],  # Specify the package explicitly if not using find_packages()
-
-    python_requires=">=3.12",
-    install_requires=[],
-    include_package_data=True,
-    zip_safe=False,
-    license="GNU v3",
-    keywords=[
-        "pyaifc", "pychunk", "chunk", "IFF", "audio", "file format", "multimedia"
-    ],
-    classifiers=[
-        "Environment :: Console",
-        "Natural Language :: English",
-        "Operating System :: OS Independent",
-        "Programming Language :: Python",
-        "Programming Language :: Python :: 3 :: Only",
-        "Programming Language :: Python :: 3.12",
-        "Programming Language :: Python :: 3.13",
-    ],
-)
+setup(ext_modules=ext_modules)
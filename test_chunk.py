@@ -0,0 +1,190 @@
+from pyaifchunk.core_chunk import Chunk, iter_chunks
+import io
+import struct
+
+# Precompiled size-field packers, mirroring pyaifchunk.core_chunk.
+_U32_BE = struct.Struct(">I")
+_U32_LE = struct.Struct("<I")
+
+# Helper function to create a chunk binary block
+
+def create_chunk(chunk_id: bytes, data: bytes, bigendian: bool = True, inclheader: bool = False, align: bool = True) -> bytes:
+    """
+    Constructs a binary chunk:
+      - chunk_id: 4-byte identifier (must be exactly 4 bytes)
+      - data: bytes of the chunk's data
+      - If inclheader is True, the size field includes the 8-byte header.
+      - If align is True and the data length is odd, a pad byte (b'\x00') is appended.
+    """
+    if len(chunk_id) != 4:
+        raise ValueError("Chunk ID must be exactly 4 bytes")
+    data_size = len(data)
+    size_value = data_size + 8 if inclheader else data_size
+    size_bytes = (_U32_BE if bigendian else _U32_LE).pack(size_value)
+    pad = b'\x00' * (align & data_size & 1)
+    # One join, no intermediate concatenation allocations
+    return b''.join((chunk_id, size_bytes, data, pad))
+
+
+def make_stream() -> io.BytesIO:
+    """
+    Builds the two-chunk test stream:
+      - Chunk 1: even data length (10 bytes), no pad byte expected.
+      - Chunk 2: odd data length (7 bytes), pad byte expected.
+    """
+    chunk1 = create_chunk(b'CHNK', b'0123456789', inclheader=False)
+    chunk2 = create_chunk(b'ODDY', b'ABCDEFG', inclheader=False)
+    # Write chunks into one binary stream without concatenating them first,
+    # avoiding an extra full copy of the payload.
+    binary_stream = io.BytesIO()
+    binary_stream.write(chunk1)
+    binary_stream.write(chunk2)
+    binary_stream.seek(0)
+    return binary_stream
+
+
+def test_even_chunk():
+    stream = make_stream()
+    c1 = Chunk(stream, align=True, bigendian=True, inclheader=False)
+    assert c1.getname() == b'CHNK'
+    assert c1.getsize() == 10
+    assert c1.read() == b'0123456789'
+    # Subsequent read should return empty bytes
+    assert c1.read() == b''
+
+
+def test_odd_chunk_read_seek_tell():
+    stream = make_stream()
+    Chunk(stream).skip()
+    # Stream is now positioned at the start of chunk 2.
+    c2 = Chunk(stream, align=True, bigendian=True, inclheader=False)
+    assert c2.getname() == b'ODDY'
+    assert c2.getsize() == 7
+    assert c2.read(4) == b'ABCD'
+    assert c2.tell() == 4
+    # Seek back to start of the chunk data and read it all.
+    c2.seek(0)
+    # The pad byte is not returned by read()
+    assert c2.read() == b'ABCDEFG'
+
+
+def test_skip():
+    stream = make_stream()
+    c1 = Chunk(stream, align=True, bigendian=True, inclheader=False)
+    c1.skip()
+    # For chunk 1, header (8 bytes) + data (10 bytes) = 18 bytes; no pad
+    # since 10 is even, so the stream lands at the start of chunk 2.
+    assert stream.tell() == 18
+
+
+def test_sequential_chunks_on_file(tmp_path):
+    # Reading a chunk to exhaustion must leave the stream positioned so
+    # the next Chunk can be constructed directly, also for fd-backed
+    # files where reads may be served by os.pread.
+    path = tmp_path / "chunks.iff"
+    path.write_bytes(create_chunk(b'CHNK', b'0123456789')
+                     + create_chunk(b'EVEN', b'AB'))
+    with open(path, 'rb') as f:
+        c1 = Chunk(f)
+        assert c1.read() == b'0123456789'
+        c2 = Chunk(f)
+        assert c2.getname() == b'EVEN'
+        assert c2.getsize() == 2
+        assert c2.read() == b'AB'
+
+
+def test_seek_then_read_on_file(tmp_path):
+    path = tmp_path / "chunks.iff"
+    path.write_bytes(create_chunk(b'CHNK', b'0123456789')
+                     + create_chunk(b'EVEN', b'AB'))
+    with open(path, 'rb') as f:
+        c1 = Chunk(f)
+        c1.seek(4)
+        assert c1.read(2) == b'45'
+        c1.seek(0)
+        assert c1.read() == b'0123456789'
+        # Exhaustion after seeking must still line the stream up for the
+        # next chunk.
+        c2 = Chunk(f)
+        assert c2.getname() == b'EVEN'
+
+
+def test_skip_crosses_pad_byte():
+    stream = make_stream()
+    Chunk(stream).skip()
+    c2 = Chunk(stream)
+    c2.skip()
+    # Chunk 2: header (8) + data (7) + pad (1); skip ends at the stream end.
+    assert stream.tell() == 18 + 16
+
+
+def test_readinto_and_read1():
+    stream = make_stream()
+    c1 = Chunk(stream)
+    buf = bytearray(4)
+    assert c1.readinto(buf) == 4
+    assert bytes(buf) == b'0123'
+    assert c1.read1(3) == b'456'
+    # A buffer larger than the remaining data is clamped to the chunk.
+    big = bytearray(64)
+    assert c1.readinto(big) == 3
+    assert bytes(big[:3]) == b'789'
+    assert c1.readinto(big) == 0
+    assert c1.read1() == b''
+
+
+def test_from_bytes():
+    payload = create_chunk(b'CHNK', b'0123456789') + create_chunk(b'ODDY', b'ABCDEFG')
+    c1 = Chunk.from_bytes(payload)
+    assert c1.getname() == b'CHNK'
+    assert c1.read() == b'0123456789'
+    # offset= addresses a chunk in the middle of the buffer directly.
+    c2 = Chunk.from_bytes(payload, offset=18)
+    assert c2.getname() == b'ODDY'
+    assert c2.read() == b'ABCDEFG'
+    # bytearray and memoryview sources work as well.
+    c3 = Chunk.from_bytes(memoryview(bytearray(payload)))
+    assert c3.read(4) == b'0123'
+
+
+def test_from_path(tmp_path):
+    path = tmp_path / "chunks.iff"
+    path.write_bytes(create_chunk(b'ODDY', b'ABCDEFG')
+                     + create_chunk(b'CHNK', b'0123456789'))
+    c1 = Chunk.from_path(path)
+    assert c1.getname() == b'ODDY'
+    assert c1.read() == b'ABCDEFG'
+    c1.skip()
+    c2 = Chunk(c1._file)
+    assert c2.getname() == b'CHNK'
+    assert c2.read() == b'0123456789'
+
+
+def test_iter_chunks():
+    payload = create_chunk(b'CHNK', b'0123456789') + create_chunk(b'ODDY', b'ABCDEFG')
+    views = list(iter_chunks(payload))
+    assert [v.getname() for v in views] == [b'CHNK', b'ODDY']
+    assert [v.getsize() for v in views] == [10, 7]
+    # Views slice the shared buffer and never return the pad byte.
+    assert views[1].read() == b'ABCDEFG'
+    views[1].seek(0)
+    assert views[1].read(3) == b'ABC'
+    assert views[1].tell() == 3
+    # skip() is a no-op on views; iteration already located every chunk.
+    views[0].skip()
+    # A file-like source is accepted too.
+    assert [v.getname() for v in iter_chunks(io.BytesIO(payload))] \
+        == [b'CHNK', b'ODDY']
+
+
+def test_chunk_is_raw_stream():
+    # Holds for the pure-Python class and, via ABC registration, for the
+    # Cython accelerator when that is what core_chunk exports.
+    stream = make_stream()
+    c1 = Chunk(stream)
+    assert isinstance(c1, io.RawIOBase)
+    assert c1.readable() and c1.seekable() and not c1.writable()
+    assert not c1.closed
+    with c1 as f:
+        assert f.read(2) == b'01'
+    assert c1.closed